@@ -1,77 +1,154 @@
 #!/usr/bin/env python3
 
-import configparser
-import aws_cdk as cdk
+import functools
 import os
-import json
+
+# Construct stack-trace capture dominates synth time; skip it unless debugging.
+# Must be set before aws_cdk is imported, since that starts the jsii kernel
+# process which reads it from its environment.
+if not os.getenv("CDK_DEBUG"):
+    os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
+
+import aws_cdk as cdk
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
 from aws_cdk import (
     Aspects,
     Tags,
 )
-from cdk_nag import AwsSolutionsChecks, NagSuppressions
 from stack.cloud_infra import cloud_infra
+from util import fast_ini
 from util.app_config import ApplicationConfig
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Multi-region config file mapping
+_REGION_CONFIG_FILES = (
+    ("eu-central-1", "resource.eu-central-1.config"),
+    ("us-east-1", "resource.us-east-1.config"),
+)
+_PRIMARY_REGION = _REGION_CONFIG_FILES[0][0]  # Use the first region as primary for IAM
+
+_STACK_ID_TMPL = "{resource_prefix}-{service_name}-{app_env}-{app_name}-infra-stack-{deployment_region}-{resource_suffix}"
+_ROLE_ARN_TMPL = "arn:aws:iam::{workload_account}:role/{resource_prefix}-{service_name}-{app_env}-{app_name}dply-role-main-a"
+
+# Every synthesizer role is the same deployment role
+_SYNTH_ROLE_PARAMS = (
+    "cloud_formation_execution_role",
+    "deploy_role_arn",
+    "file_asset_publishing_role_arn",
+    "image_asset_publishing_role_arn",
+    "lookup_role_arn",
+)
+
+_STATIC_TAGS = (
+    ("sw:application", "mra"),
+    ("sw:product", "mra"),
+)
+
+_NAG_SUPPRESSIONS = [
+    {'id': 'AwsSolutions-S1', 'reason': 'Cloudtrail already capturing access of S3 data plane'},
+    {'id': 'AwsSolutions-IAM5', 'reason': 'IAM policy with resource star'},
+    {'id': 'AwsSolutions-IAM4', 'reason': 'IAM managed policy'}
+]
+
+@functools.lru_cache(maxsize=4)
 def load_applications_from_json(file_path):
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    return [ApplicationConfig(app) for app in data]
+    data = json_loads(Path(file_path).read_bytes())
+    return tuple(ApplicationConfig(app) for app in data)
 
-def get_def_stack_synth(config):
-    return cdk.DefaultStackSynthesizer(
-        cloud_formation_execution_role=f"arn:aws:iam::{config['workload_account']}:role/{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}dply-role-main-a",
-        deploy_role_arn=f"arn:aws:iam::{config['workload_account']}:role/{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}dply-role-main-a",
-        file_asset_publishing_role_arn=f"arn:aws:iam::{config['workload_account']}:role/{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}dply-role-main-a",
-        image_asset_publishing_role_arn=f"arn:aws:iam::{config['workload_account']}:role/{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}dply-role-main-a",
-        lookup_role_arn=f"arn:aws:iam::{config['workload_account']}:role/{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}dply-role-main-a",
-        file_assets_bucket_name=f"{config['asset_prefix']}-{config['workload_account']}-{config['deployment_region']}-{config['resource_suffix']}",
+def load_region_config(config_file, branch_name, primary_region, region):
+    section = fast_ini.load(config_file)[branch_name]
+
+    # Overlay the per-region keys instead of copying the parsed section
+    return ChainMap({"primary_region": primary_region, "deployment_region": region}, section)
+
+@functools.lru_cache(maxsize=None)
+def stack_synth_factory(role_arn, file_assets_bucket_name, bootstrap_stack_version):
+    # A synthesizer can only be bound to a single stack, so cache the factory
+    # rather than the synthesizer instance
+    return functools.partial(
+        cdk.DefaultStackSynthesizer,
+        **dict.fromkeys(_SYNTH_ROLE_PARAMS, role_arn),
+        file_assets_bucket_name=file_assets_bucket_name,
         # image_assets_repository_name=cdk_custom_configs.get('bootstrap_image_assets_repository_name')
-        bootstrap_stack_version_ssm_parameter=f"{config['bootstrap_stack_version']}"
+        bootstrap_stack_version_ssm_parameter=bootstrap_stack_version
     )
 
+def get_def_stack_synth(config):
+    return stack_synth_factory(
+        _ROLE_ARN_TMPL.format_map(config),
+        f"{config['asset_prefix']}-{config['workload_account']}-{config['deployment_region']}-{config['resource_suffix']}",
+        f"{config['bootstrap_stack_version']}"
+    )()
+
 if __name__ == "__main__":
     # Reading Application infra resource varibales using git branch name
     branch_name = os.getenv("SRC_BRANCH", "dev")
 
-    # Multi-region config file mapping
-    region_config_files = {
-        "eu-central-1": "resource.eu-central-1.config",
-        "us-east-1": "resource.us-east-1.config",
-    }
-    regions = list(region_config_files.keys())
-    primary_region = regions[0]  # Use the first region as primary for IAM
+    # cdk-nag checks are on by default; ENABLE_CDK_NAG=0 skips importing it
+    enable_nag = os.getenv("ENABLE_CDK_NAG", "1") == "1"
+    if enable_nag:
+        from cdk_nag import AwsSolutionsChecks, NagSuppressions
+
     stacks = []
 
+    def prep(region_config_file):
+        region, config_file = region_config_file
+        return region, load_region_config(config_file, branch_name, _PRIMARY_REGION, region)
+
+    # Parse every region config (and the app list, which is identical for every
+    # region) concurrently up front; stacks are built sequentially afterwards
+    # since construct creation is not thread-safe
+    with ThreadPoolExecutor(max_workers=len(_REGION_CONFIG_FILES) + 1) as executor:
+        app_config_future = executor.submit(load_applications_from_json, f"config/canary_app_list_{branch_name}.json")
+        parsed = list(executor.map(prep, _REGION_CONFIG_FILES))
+        app_config = app_config_future.result()
+
     # Initializing CDK app
     app = cdk.App()
+    if enable_nag:
+        Aspects.of(app).add(AwsSolutionsChecks())
+
+    # Optionally only build the stacks selected on the cdk command line. The CLI
+    # only puts the requested patterns into the bundling-stacks context for
+    # deploy/diff/synth/watch with -e/--exclusively (e.g.
+    # "cdk deploy -e <prefix>-us-east-1-*"); otherwise it passes "**" and every
+    # stack is built
+    requested_stacks = []
+    if os.getenv("SKIP_UNREQUESTED_STACKS") == "1":
+        requested_stacks = app.node.try_get_context("aws:cdk:bundling-stacks") or []
+
+    for region, config in parsed:
+        stack_name = _STACK_ID_TMPL.format_map(config)
+        if requested_stacks and not any(fnmatch(stack_name, pattern) for pattern in requested_stacks):
+            continue
 
-    for region in regions:
-        config_parser = configparser.ConfigParser()
-        config_parser.read(region_config_files[region])
-        config = config_parser[branch_name]
-        config = dict(config)
-        config["primary_region"] = primary_region
-        config["deployment_region"] = region
-        app_config = load_applications_from_json(f"config/canary_app_list_{branch_name}.json")
         stack = cloud_infra(
             app,
-            f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-infra-stack-{region}-{config['resource_suffix']}",
+            stack_name,
             resource_config=config,
             app_config=app_config,
             env=cdk.Environment(account=f"{config['workload_account']}", region=region),
             synthesizer=get_def_stack_synth(config)
         )
-        Tags.of(stack).add("sw:application", "mra")
-        Tags.of(stack).add("sw:product", "mra")
-        Tags.of(stack).add("sw:environment", f"{config['app_env']}")
-        Tags.of(stack).add("sw:cost_center", f"{config['cost_center']}")
-        Aspects.of(app).add(AwsSolutionsChecks())
-        NagSuppressions.add_stack_suppressions(stack, [
-            {'id': 'AwsSolutions-S1', 'reason': 'Cloudtrail already capturing access of S3 data plane'},
-            {'id': 'AwsSolutions-IAM5', 'reason': 'IAM policy with resource star'},
-            {'id': 'AwsSolutions-IAM4', 'reason': 'IAM managed policy'}
-        ])
+        tagger = Tags.of(stack)
+        for key, value in _STATIC_TAGS:
+            tagger.add(key, value)
+        tagger.add("sw:environment", config['app_env'])
+        tagger.add("sw:cost_center", config['cost_center'])
+        if enable_nag:
+            NagSuppressions.add_stack_suppressions(stack, _NAG_SUPPRESSIONS)
         stacks.append(stack)
 
-    # Synthesize and produce CloudFormation template
-    app.synth()
+    # Synthesize and produce CloudFormation template. CDK_VALIDATE=0 skips the
+    # construct validation pass for pipelines that already validated the app
+    app.synth(
+        force=os.getenv("CDK_FORCE_SYNTH") == "1",
+        skip_validation=os.getenv("CDK_VALIDATE", "1") != "1"
+    )
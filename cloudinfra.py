@@ -1,3 +1,7 @@
+import functools
+import sys
+from string import Template
+from itertools import product
 from constructs import Construct
 from aws_cdk import (
     Duration,
@@ -5,50 +9,153 @@ from aws_cdk import (
     Stack,
     aws_s3 as s3,
     aws_iam as iam,
-    aws_lambda as _lambda,
-    aws_events as events,
-    aws_events_targets as targets,
-    aws_ecr as ecr,
     aws_ec2 as ec2,
-    aws_certificatemanager as cert,
     aws_logs as logs,
-    aws_ecs as ecs,
-    aws_elasticloadbalancingv2 as elbv2,
-    aws_route53 as route53,
     aws_fis as fis,
     aws_synthetics as synthetics,
 )
 
-from util.app_config import ApplicationConfig
+_ALLOW = iam.Effect.ALLOW
+# Shared statement literals, treat as read-only
+_ALL = ["*"]
+_NI_ACTIONS = (
+    "ec2:CreateNetworkInterface",
+    "ec2:DescribeNetworkInterfaces",
+    "ec2:DeleteNetworkInterface"
+)
+
+@functools.lru_cache(maxsize=None)
+def _service_principal(service):
+    return iam.ServicePrincipal(service)
+
+# FIS template properties that never vary. These are plain value objects
+# (not constructs), so one instance can be shared by every template.
+_EXPERIMENT_OPTIONS = fis.CfnExperimentTemplate.ExperimentTemplateExperimentOptionsProperty(
+    account_targeting="single-account",
+    empty_target_resolution_mode="fail"
+)
+
+_STOP_CONDITIONS = [
+    {
+        "source": "none"
+    }
+]
+
+_DISRUPT_PARAMS = {
+    "duration": "PT15M",  # Duration of the network disruption
+    "scope": "all"
+}
+
+_AZ_RDS_FAILOVER_ACTION = fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
+    action_id="aws:rds:failover-db-cluster",
+    description="Aurora Serverless RDS Failover DB",
+    parameters={},
+    targets={
+        "Clusters": "RDSFailover"
+    }
+)
+
+_AZ_PAUSE_ELASTICACHE_ACTION = fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
+    action_id="aws:elasticache:replicationgroup-interrupt-az-power",
+    parameters={
+        "duration": "PT15M"
+    },
+    targets={
+        "ReplicationGroups": "ElastiCacheCluster"
+    }
+)
+
+_FIS_WAIT_ACTION = fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
+    action_id="aws:fis:wait",
+    parameters={
+        "duration": "PT15M"
+    },
+    targets={}
+)
+
+# Template id of the ECS task stop experiments, rendered once per service/percent pair
+_ID_TMPL = Template("$prefix-ecs-taskstop-$name-p$pct-experiment-$suffix")
+
+_CANARY_SCRIPT = '''import json
+import os
+import http.client
+from selenium.webdriver.common.by import By
+import urllib.parse
+from aws_synthetics.selenium import synthetics_webdriver as syn_webdriver
+from aws_synthetics.common import synthetics_logger as logger
+
+def verify_request(method, url, post_data=None, headers={}):
+    parsed_url = urllib.parse.urlparse(url)
+    user_agent = str(syn_webdriver.get_canary_user_agent_string())
+    if "User-Agent" in headers:
+        headers["User-Agent"] = f"{user_agent} {headers['User-Agent']}"
+    else:
+        headers["User-Agent"] = user_agent
+
+    logger.info(f"Making request with Method: '{method}' URL: {url}: Data: {json.dumps(post_data)} Headers: {json.dumps(headers)}")
+
+    if parsed_url.scheme == "https":
+        conn = http.client.HTTPSConnection(parsed_url.hostname, parsed_url.port)
+    else:
+        conn = http.client.HTTPConnection(parsed_url.hostname, parsed_url.port)
+
+    conn.request(method, url, post_data, headers)
+    response = conn.getresponse()
+    logger.info(f"Status Code: {response.status}")
+    logger.info(f"Response Headers: {json.dumps(response.headers.as_string())}")
+
+    if not response.status or response.status < 200 or response.status > 299:
+        try:
+            logger.error(f"Response: {response.read().decode()}")
+        finally:
+            if response.reason:
+                conn.close()
+                raise Exception(f"Failed: {response.reason}")
+            else:
+                conn.close()
+                raise Exception(f"Failed with status code: {response.status}")
+
+    logger.info(f"Response: {response.read().decode()}")
+    logger.info("HTTP request successfully executed.")
+    conn.close()
+	
+def handler(event, context):
+    
+    url = os.environ['TARGET_URL']  # Read the environment variable for the URL
+    method = 'GET'
+    postData = ""
+    headers1 = {}
+    
+    verify_request(method, url, None, headers1)
+    logger.info("Canary successfully executed.")
+'''
 
 class cloud_infra(Stack):
 
     def create_canary_security_group(self, config, vpc):
+        sg_name = f"{self._name_base}-canary-sg-{self._name_suffix}"
 
         # security group
         sg = ec2.SecurityGroup(
             self,
-            id=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-sg-{config['resource_suffix']}",
-            security_group_name=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-sg-{config['resource_suffix']}",
+            id=sg_name,
+            security_group_name=sg_name,
             description="Allow the communication from Canary",
             allow_all_outbound=False,
             # if this is set to false then no egress rule will be automatically created
             vpc=vpc
         )
 
+        port_443 = ec2.Port.tcp(443)
         sg.add_egress_rule(
             ec2.Peer.ipv4(vpc.vpc_cidr_block),
-            ec2.Port.tcp(443)
-        )
-
-        s3_prefix_list = ec2.PrefixList.from_prefix_list_id(
-            self, id="S3PrefixList",
-            prefix_list_id=config['s3_prefix_list']
+            port_443
         )
 
+        # Peer.prefix_list takes the id directly, no need to import the prefix list
         sg.add_egress_rule(
-            ec2.Peer.prefix_list(s3_prefix_list.prefix_list_id),
-            ec2.Port.tcp(443)
+            ec2.Peer.prefix_list(config['s3_prefix_list']),
+            port_443
         )
 
         return sg
@@ -56,8 +163,8 @@ class cloud_infra(Stack):
     def create_artifact_store(self, config) -> s3.Bucket:
 
         bucket = s3.Bucket(self,
-                           id=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-s3-{config['resource_suffix']}",
-                           bucket_name=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-s3-{config['workload_account']}-{config['resource_suffix']}",
+                           id=f"{self._name_base}-canary-s3-{self._name_suffix}",
+                           bucket_name=f"{self._name_base}-canary-s3-{config['workload_account']}-{self._name_suffix}",
                            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
                            encryption=s3.BucketEncryption.S3_MANAGED,
                            minimum_tls_version=1.2,
@@ -67,7 +174,7 @@ class cloud_infra(Stack):
                            versioned=True,
                            lifecycle_rules=[s3.LifecycleRule(
                                enabled=True,
-                               id=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-s3-lifecycle-{config['resource_suffix']}",
+                               id=f"{self._name_base}-s3-lifecycle-{self._name_suffix}",
                                noncurrent_version_expiration=Duration.days(
                                    7),
                                noncurrent_versions_to_retain=1
@@ -78,138 +185,76 @@ class cloud_infra(Stack):
         return bucket
 
     #create canary role
-    def create_canary_role(self, config, bucket_name) -> iam.Role:
-        canary_role = iam.Role(self,
-                               id=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-role-{config['resource_suffix']}",
-                               assumed_by=iam.ServicePrincipal('lambda.amazonaws.com'),
-                               role_name=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-role-{config['resource_suffix']}",
-                               managed_policies=[
-                                   iam.ManagedPolicy.from_aws_managed_policy_name('CloudWatchSyntheticsFullAccess'),
-                                   iam.ManagedPolicy.from_aws_managed_policy_name('AmazonEC2FullAccess')
-                               ]
-                               )
-
-        canary_role.add_to_policy(
+    def create_canary_role(self, config, bucket: s3.Bucket) -> iam.Role:
+        role_name = f"{self._name_base}-canary-role-{self._name_suffix}"
+        statements = [
             iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
+                effect=_ALLOW,
                 actions=[
                     "s3:PutObject",
                     "s3:GetObject"
                 ],
                 resources=[
-                    f"arn:aws:s3:::{bucket_name}/*"
+                    bucket.arn_for_objects("*")
                 ]
-            )
-        )
-
-        canary_role.add_to_policy(
+            ),
             iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
+                effect=_ALLOW,
                 actions=[
                     "s3:GetBucketLocation"
                 ],
                 resources=[
-                    f"arn:aws:s3:::{bucket_name}"
+                    bucket.bucket_arn
                 ]
-            )
-        )
-
-        canary_role.add_to_policy(
+            ),
             iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
+                effect=_ALLOW,
                 actions=[
                     "logs:CreateLogStream",
                     "logs:PutLogEvents",
                     "logs:CreateLogGroup"
                 ],
                 resources=[
-                    f"arn:aws:logs:*:{self.account}:log-group:/aws/lambda/*"
+                    "arn:aws:logs:*:" + self.account + ":log-group:/aws/lambda/*"
                 ]
-            )
-        )
-
-        canary_role.add_to_policy(
+            ),
             iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
+                effect=_ALLOW,
                 actions=[
                     "s3:ListAllMyBuckets",
                     "xray:PutTraceSegments",
                     "cloudwatch:PutMetricData",
-                    "ec2:CreateNetworkInterface",
-                    "ec2:DescribeNetworkInterfaces",
-                    "ec2:DeleteNetworkInterface"
+                    *_NI_ACTIONS
                 ],
-                resources=["*"]
+                resources=_ALL
             )
-        )
-
-        return canary_role
-
-    def canary_script_data(self, config):
-        canary_script = '''import json
-import os
-import http.client
-from selenium.webdriver.common.by import By
-import urllib.parse
-from aws_synthetics.selenium import synthetics_webdriver as syn_webdriver
-from aws_synthetics.common import synthetics_logger as logger
+        ]
 
-def verify_request(method, url, post_data=None, headers={}):
-    parsed_url = urllib.parse.urlparse(url)
-    user_agent = str(syn_webdriver.get_canary_user_agent_string())
-    if "User-Agent" in headers:
-        headers["User-Agent"] = f"{user_agent} {headers['User-Agent']}"
-    else:
-        headers["User-Agent"] = user_agent
-
-    logger.info(f"Making request with Method: '{method}' URL: {url}: Data: {json.dumps(post_data)} Headers: {json.dumps(headers)}")
-
-    if parsed_url.scheme == "https":
-        conn = http.client.HTTPSConnection(parsed_url.hostname, parsed_url.port)
-    else:
-        conn = http.client.HTTPConnection(parsed_url.hostname, parsed_url.port)
-
-    conn.request(method, url, post_data, headers)
-    response = conn.getresponse()
-    logger.info(f"Status Code: {response.status}")
-    logger.info(f"Response Headers: {json.dumps(response.headers.as_string())}")
-
-    if not response.status or response.status < 200 or response.status > 299:
-        try:
-            logger.error(f"Response: {response.read().decode()}")
-        finally:
-            if response.reason:
-                conn.close()
-                raise Exception(f"Failed: {response.reason}")
-            else:
-                conn.close()
-                raise Exception(f"Failed with status code: {response.status}")
-
-    logger.info(f"Response: {response.read().decode()}")
-    logger.info("HTTP request successfully executed.")
-    conn.close()
-	
-def handler(event, context):
-    
-    url = os.environ['TARGET_URL']  # Read the environment variable for the URL
-    method = 'GET'
-    postData = ""
-    headers1 = {}
-    
-    verify_request(method, url, None, headers1)
-    logger.info("Canary successfully executed.")
-'''
+        # One statement per resource scope, all in a single inline policy on the role
+        canary_role = iam.Role(self,
+                               id=role_name,
+                               assumed_by=_service_principal('lambda.amazonaws.com'),
+                               role_name=role_name,
+                               managed_policies=[
+                                   iam.ManagedPolicy.from_aws_managed_policy_name('CloudWatchSyntheticsFullAccess'),
+                                   iam.ManagedPolicy.from_aws_managed_policy_name('AmazonEC2FullAccess')
+                               ],
+                               inline_policies={
+                                   f"{self._name_base}-canary-policy-{self._name_suffix}": iam.PolicyDocument(statements=statements)
+                               }
+                               )
 
-        return canary_script
+        return canary_role
 
     def create_canary(self, config, vpc, subnet_ids, security_group_id, canary_role,
                       target_url, canary_script, app_name, bucket_name):
+        canary_name = f"{self._name_base}-canary-{app_name}-{self._name_suffix}"
         # Create the Canary inside the existing VPC
         canary = synthetics.CfnCanary(self,
-                                      id=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-{app_name}-{config['resource_suffix']}",
-                                      name=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-{app_name}-{config['resource_suffix']}",
+                                      id=canary_name,
+                                      name=canary_name,
                                       runtime_version="syn-python-selenium-5.0",
-                                      artifact_s3_location=f"s3://{bucket_name}/canary/{self.region}/{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-canary-{app_name}-{config['resource_suffix']}",
+                                      artifact_s3_location=f"s3://{bucket_name}/canary/{self.region}/{canary_name}",
                                       execution_role_arn=canary_role.role_arn,
                                       code=synthetics.CfnCanary.CodeProperty(
                                           handler="index.handler",
@@ -238,28 +283,21 @@ def handler(event, context):
 
     # Create task execution role for FIS service
     def create_fis_role(self, config) -> iam.Role:
-        exec_role = iam.Role(
-            self,
-            id=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-exec-role-{config['resource_suffix']}",
-            assumed_by=iam.ServicePrincipal('fis.amazonaws.com'),
-            role_name=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-exec-role-{config['resource_suffix']}"
-        )
-
-        exec_role.add_to_policy(
+        role_name = f"{self._name_base}-exec-role-{self._name_suffix}"
+        workload_account, account = config['workload_account'], self.account
+        fis_arn = "arn:aws:fis:*:" + workload_account + ":"
+        statements = [
             iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                actions= ["fis:*"],
+                effect=_ALLOW,
+                actions=["fis:*"],
                 resources=[
-                    f"arn:aws:fis:*:{config['workload_account']}:experiment-template/*",
-                    f"arn:aws:fis:*:{config['workload_account']}:safety-lever/*",
-                    f"arn:aws:fis:*:{config['workload_account']}:action/*",
-                    f"arn:aws:fis:*:{config['workload_account']}:experiment/*"
+                    fis_arn + "experiment-template/*",
+                    fis_arn + "safety-lever/*",
+                    fis_arn + "action/*",
+                    fis_arn + "experiment/*"
                 ]
-            )
-        )
-
-        exec_role.add_to_policy(
-            iam.PolicyStatement(effect=iam.Effect.ALLOW,
+            ),
+            iam.PolicyStatement(effect=_ALLOW,
                                 actions=[
                                     "fis:ListExperimentTemplates",
                                     "fis:ListActions",
@@ -270,68 +308,68 @@ def handler(event, context):
                                     "logs:UpdateLogDelivery",
                                     "logs:GetLogDelivery",
                                     "logs:ListLogDeliveries",
-                                    "ec2:CreateNetworkInterface",
+                                    *_NI_ACTIONS,
                                     "ec2:DeleteNetworkInterfacePermission",
-                                    "ec2:DescribeNetworkInterfaces",
                                     "ec2:CreateNetworkInterfacePermission",
                                     "ec2:DescribeVpcs",
                                     "ec2:CreateTags",
-                                    "ec2:DeleteNetworkInterface",
                                     "ec2:DescribeSubnets"
                                 ],
-                                resources=["*"]
-                                )
-        )
-
-        exec_role.add_to_policy(
+                                resources=_ALL
+                                ),
             iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
+                effect=_ALLOW,
                 actions=["iam:CreateServiceLinkedRole"],
-                resources=[f"arn:aws:iam::{config['workload_account']}:role/*"]
-            )
-        )
-
-        exec_role.add_to_policy(
+                resources=["arn:aws:iam::" + workload_account + ":role/*"]
+            ),
             iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
+                effect=_ALLOW,
                 actions=["logs:CreateLogStream", "logs:PutLogEvents"],
                 resources=["arn:aws:logs:*:*:log-group:/sw/fis/*:*"]
-            )
-        )
-
-        exec_role.add_to_policy(
+            ),
             iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                actions=["elasticache:InterruptClusterAzPower","elasticache:TestFailover","elasticache:FailoverGlobalReplicationGroup"],
-                resources=[f"arn:aws:elasticache:*:{self.account}:replicationgroup:*",f"arn:aws:elasticache::{self.account}:globalreplicationgroup:*"]
+                effect=_ALLOW,
+                actions=["elasticache:InterruptClusterAzPower", "elasticache:TestFailover", "elasticache:FailoverGlobalReplicationGroup"],
+                resources=[
+                    "arn:aws:elasticache:*:" + account + ":replicationgroup:*",
+                    "arn:aws:elasticache::" + account + ":globalreplicationgroup:*"
+                ]
             )
-        )
-
-        exec_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSFaultInjectionSimulatorNetworkAccess")
-        )
-
-        exec_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSFaultInjectionSimulatorRDSAccess")
-        )
-
-        exec_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSFaultInjectionSimulatorECSAccess")
-        )
+        ]
 
-        exec_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSFaultInjectionSimulatorSSMAccess")
+        # One statement per resource scope, all in a single inline policy on the role
+        exec_role = iam.Role(
+            self,
+            id=role_name,
+            assumed_by=_service_principal('fis.amazonaws.com'),
+            role_name=role_name,
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(name)
+                for name in (
+                    "service-role/AWSFaultInjectionSimulatorNetworkAccess",
+                    "service-role/AWSFaultInjectionSimulatorRDSAccess",
+                    "service-role/AWSFaultInjectionSimulatorECSAccess",
+                    "service-role/AWSFaultInjectionSimulatorSSMAccess"
+                )
+            ],
+            inline_policies={
+                f"{self._name_base}-exec-policy-{self._name_suffix}": iam.PolicyDocument(statements=statements)
+            }
         )
 
         return exec_role
 
     def lookup_vpc(self, config):
-        # vpc lookup from account
-        vpc = ec2.Vpc.from_lookup(
-            self,
-            f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-vpc-{config['resource_suffix']}",
-            vpc_id=f"{config['vpc_id']}"
-        )
+        # vpc lookup from account, cached per vpc id since each lookup is a
+        # context provider call
+        vpc_id = f"{config['vpc_id']}"
+        vpc = self._vpcs.get(vpc_id)
+        if vpc is None:
+            vpc = self._vpcs[vpc_id] = ec2.Vpc.from_lookup(
+                self,
+                vpc_id,
+                vpc_id=vpc_id
+            )
 
         return vpc
 
@@ -348,359 +386,134 @@ def handler(event, context):
         return subnet
 
     def create_log_group(self, config):
+        log_group_name = f"{self._name_base}-fis-logs-{self._name_suffix}"
         log_group = logs.LogGroup(
             self,
-            id=f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-fis-logs-{config['resource_suffix']}",
-            log_group_name=f"/sw/fis/{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-fis-logs-{config['resource_suffix']}",
+            id=log_group_name,
+            log_group_name=f"/sw/fis/{log_group_name}",
             retention=logs.RetentionDays.ONE_MONTH,
             removal_policy=RemovalPolicy.DESTROY,
         )
 
         return log_group
 
-    def create_fis_network_subnet_experiment(self, config, subnet_list, test_name, role, log_group, az_name, db_app_list):
-        db_arns = []
-        for db_app_name in db_app_list.split(","):
-            db_arns.append(f"arn:aws:rds:{self.region}:{self.account}:cluster:{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{db_app_name}-{config['resource_suffix']}")
-
-        subnet_arns = []
-        for subnet in subnet_list.split(","):
-            subnet_arns.append(f"arn:aws:ec2:{self.region}:{self.account}:subnet/{subnet}")
+    def create_fis_network_subnet_experiment(self, subnets, test_name, az_name):
+        template_name = "-".join((self._name_base, "azfailure-experiment", test_name, self._name_suffix))
+        region, account = self.region, self.account
+        subnet_arns = [f"arn:aws:ec2:{region}:{account}:subnet/{subnet}" for subnet in subnets]
 
         experiment_template = fis.CfnExperimentTemplate(self,
-                                                        f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-azfailure-experiment-{test_name}-{config['resource_suffix']}",
+                                                        template_name,
                                                         description=f"AZ Power Failure Simulation in {test_name}",
-                                                        role_arn=role.role_arn,
                                                         targets={
-                                                            "SubnetDown": fis.CfnExperimentTemplate.ExperimentTemplateTargetProperty(
-                                                                resource_type="aws:ec2:subnet",
-                                                                resource_arns=subnet_arns,
-                                                                selection_mode="ALL",
-                                                                parameters={}
-                                                            ),
-                                                            "RDSFailover": fis.CfnExperimentTemplate.ExperimentTemplateTargetProperty(
-                                                                resource_type="aws:rds:cluster",
-                                                                resource_tags={"sw:product" : "mra"},
-                                                                selection_mode="ALL",
-                                                                parameters={
+                                                            "SubnetDown": {
+                                                                "resourceType": "aws:ec2:subnet",
+                                                                "resourceArns": subnet_arns,
+                                                                "selectionMode": "ALL",
+                                                                "parameters": {}
+                                                            },
+                                                            "RDSFailover": {
+                                                                "resourceType": "aws:rds:cluster",
+                                                                "resourceTags": {"sw:product" : "mra"},
+                                                                "selectionMode": "ALL",
+                                                                "parameters": {
                                                                     "writerAvailabilityZoneIdentifiers": az_name
                                                                 }
-                                                            ),
-                                                            "ElastiCacheCluster": fis.CfnExperimentTemplate.ExperimentTemplateTargetProperty(
-                                                                resource_type="aws:elasticache:replicationgroup",
-                                                                resource_tags={"sw:product" : "mra"},
-                                                                selection_mode="ALL",
-                                                                parameters={
+                                                            },
+                                                            "ElastiCacheCluster": {
+                                                                "resourceType": "aws:elasticache:replicationgroup",
+                                                                "resourceTags": {"sw:product" : "mra"},
+                                                                "selectionMode": "ALL",
+                                                                "parameters": {
                                                                     "availabilityZoneIdentifier": az_name
                                                                 }
-                                                            )
+                                                            }
                                                         },
                                                         actions={
-                                                            "DisruptNetworkConnectivity": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:network:disrupt-connectivity",
-                                                                description=f"Disrupt network connectivity for subnets in {test_name}",
-                                                                parameters={
-                                                                    "duration": "PT15M",  # Duration of the network disruption
-                                                                    "scope": "all"
-                                                                },
-                                                                targets={
+                                                            "DisruptNetworkConnectivity": {
+                                                                "actionId": "aws:network:disrupt-connectivity",
+                                                                "description": f"Disrupt network connectivity for subnets in {test_name}",
+                                                                "parameters": _DISRUPT_PARAMS,
+                                                                "targets": {
                                                                     "Subnets": "SubnetDown"
                                                                 }
-                                                            ),
-                                                            "RDSFailoverAction": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:rds:failover-db-cluster",
-                                                                description="Aurora Serverless RDS Failover DB",
-                                                                parameters={},
-                                                                targets={
-                                                                    "Clusters": "RDSFailover"
-                                                                }
-                                                            ),
-                                                            "PauseElastiCache": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:elasticache:replicationgroup-interrupt-az-power",
-                                                                parameters={
-                                                                    "duration": "PT15M"
-                                                                },
-                                                                targets={
-                                                                    "ReplicationGroups": "ElastiCacheCluster"
-                                                                }
-                                                            ),
-                                                            "FISWait": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:fis:wait",
-                                                                parameters={
-                                                                    "duration": "PT15M"
-                                                                },
-                                                                targets={}
-                                                            )
-                                                        },
-                                                        experiment_options=fis.CfnExperimentTemplate.ExperimentTemplateExperimentOptionsProperty(
-                                                            account_targeting="single-account",
-                                                            empty_target_resolution_mode="fail"
-                                                        ),
-                                                        log_configuration=fis.CfnExperimentTemplate.ExperimentTemplateLogConfigurationProperty(
-                                                            cloud_watch_logs_configuration={
-                                                                "LogGroupArn": log_group.log_group_arn
                                                             },
-                                                            log_schema_version=2
-                                                        ),
-                                                        stop_conditions=[
-                                                            {
-                                                                "source": "none"
-                                                            }
-                                                        ],
-                                                        tags={
-                                                            "Name": f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-azfailure-experiment-{test_name}-{config['resource_suffix']}",
-                                                            "Environment": f"{config['app_env']}"
-                                                        }
-                                                        )
-
-        return experiment_template
-
-    def create_fis_ecs_cluster_drain_experiment(self, config, role, log_group, percent):
-        experiment_template = fis.CfnExperimentTemplate(self,
-                                                        f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-ecs-drain-p{percent}-experiment-{config['resource_suffix']}",
-                                                        description=f"Drain ECS cluster container instances in percent {percent}",
-                                                        role_arn=role.role_arn,
-                                                        targets={
-                                                            "ECSClusterDrain": fis.CfnExperimentTemplate.ExperimentTemplateTargetProperty(
-                                                                resource_type="aws:ecs:cluster",
-                                                                resource_arns=[
-                                                                    f"arn:aws:ecs:{self.region}:{self.account}:cluster/{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-ecs-cluster-infra-{config['resource_suffix']}"
-                                                                ],
-                                                                selection_mode="ALL"
-                                                            )
-                                                        },
-                                                        actions={
-                                                            "ECSDrain": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:ecs:drain-container-instances",
-                                                                description=f"Drain ECS cluster container instances in percent {percent}",
-                                                                parameters={
-                                                                    "drainagePercentage": percent,  # Duration of the network disruption
-                                                                    "duration": "PT15M"
-                                                                },
-                                                                targets={
-                                                                    "Clusters": "ECSClusterDrain"
-                                                                }
-                                                            )
+                                                            "RDSFailoverAction": _AZ_RDS_FAILOVER_ACTION,
+                                                            "PauseElastiCache": _AZ_PAUSE_ELASTICACHE_ACTION,
+                                                            "FISWait": _FIS_WAIT_ACTION
                                                         },
-                                                        experiment_options=fis.CfnExperimentTemplate.ExperimentTemplateExperimentOptionsProperty(
-                                                            account_targeting="single-account",
-                                                            empty_target_resolution_mode="fail"
-                                                        ),
-                                                        log_configuration=fis.CfnExperimentTemplate.ExperimentTemplateLogConfigurationProperty(
-                                                            cloud_watch_logs_configuration={
-                                                                "LogGroupArn": log_group.log_group_arn
-                                                            },
-                                                            log_schema_version=2
-                                                        ),
-                                                        stop_conditions=[
-                                                            {
-                                                                "source": "none"
-                                                            }
-                                                        ],
+                                                        **self._common_fis_kwargs,
                                                         tags={
-                                                            "Name": f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-ecs-drain-p{percent}-experiment-{config['resource_suffix']}",
-                                                            "Environment": f"{config['app_env']}"
+                                                            "Name": template_name,
+                                                            "Environment": self._tag_env
                                                         }
                                                         )
 
         return experiment_template
 
-    def create_fis_rds_failover_experiment(self, config, role, log_group, db_app_name):
+    def create_fis_rds_failover_experiment(self, db_app_name):
+        template_name = "-".join((self._name_base, "rdsfailover", db_app_name, "experiment", self._name_suffix))
         experiment_template = fis.CfnExperimentTemplate(self,
-                                                        f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-rdsfailover-{db_app_name}-experiment-{config['resource_suffix']}",
+                                                        template_name,
                                                         description=f"Aurora Serverless RDS Failover DB {db_app_name}",
-                                                        role_arn=role.role_arn,
                                                         targets={
-                                                            "RDSFailover": fis.CfnExperimentTemplate.ExperimentTemplateTargetProperty(
-                                                                resource_type="aws:rds:cluster",
-                                                                resource_arns=[
-                                                                    f"arn:aws:rds:{self.region}:{self.account}:cluster:{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{db_app_name}-{config['resource_suffix']}"
+                                                            "RDSFailover": {
+                                                                "resourceType": "aws:rds:cluster",
+                                                                "resourceArns": [
+                                                                    f"{self._rds_cluster_arn_prefix}{db_app_name}-{self._name_suffix}"
                                                                 ],
-                                                                selection_mode="ALL"
-                                                            )
+                                                                "selectionMode": "ALL"
+                                                            }
                                                         },
                                                         actions={
-                                                            "RDSFailoverAction": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:rds:failover-db-cluster",
-                                                                description=f"Aurora Serverless RDS Failover DB {db_app_name}",
-                                                                parameters={},
-                                                                targets={
+                                                            "RDSFailoverAction": {
+                                                                "actionId": "aws:rds:failover-db-cluster",
+                                                                "description": f"Aurora Serverless RDS Failover DB {db_app_name}",
+                                                                "parameters": {},
+                                                                "targets": {
                                                                     "Clusters": "RDSFailover"
                                                                 }
-                                                            )
-                                                        },
-                                                        experiment_options=fis.CfnExperimentTemplate.ExperimentTemplateExperimentOptionsProperty(
-                                                            account_targeting="single-account",
-                                                            empty_target_resolution_mode="fail"
-                                                        ),
-                                                        log_configuration=fis.CfnExperimentTemplate.ExperimentTemplateLogConfigurationProperty(
-                                                            cloud_watch_logs_configuration={
-                                                                "LogGroupArn": log_group.log_group_arn
-                                                            },
-                                                            log_schema_version=2
-                                                        ),
-                                                        stop_conditions=[
-                                                            {
-                                                                "source": "none"
                                                             }
-                                                        ],
+                                                        },
+                                                        **self._common_fis_kwargs,
                                                         tags={
-                                                            "Name": f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-rdsfailover-{db_app_name}-experiment-{config['resource_suffix']}",
-                                                            "Environment": f"{config['app_env']}"
+                                                            "Name": template_name,
+                                                            "Environment": self._tag_env
                                                         }
                                                         )
 
         return experiment_template
 
-    def create_fis_ecs_task_stop_experiment(self, config, role, log_group, ecs_app_name, percent):
+    def create_fis_ecs_task_stop_experiment(self, ecs_app_name, percent, selection_mode):
+        template_name = _ID_TMPL.substitute(prefix=self._name_base, name=ecs_app_name,
+                                            pct=percent, suffix=self._name_suffix)
         experiment_template = fis.CfnExperimentTemplate(self,
-                                                        f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-ecs-taskstop-{ecs_app_name}-p{percent}-experiment-{config['resource_suffix']}",
+                                                        template_name,
                                                         description=f"Stop ECS Task for service app {ecs_app_name} with percent {percent}",
-                                                        role_arn=role.role_arn,
                                                         targets={
-                                                            "ECSTaskStop": fis.CfnExperimentTemplate.ExperimentTemplateTargetProperty(
-                                                                resource_type="aws:ecs:task",
-                                                                parameters={
-                                                                    "cluster": f"{config['resource_prefix']}-mra-{config['app_env']}-ecs-cluster-fra-{config['resource_suffix']}",
-                                                                    "service": f"{config['resource_prefix']}-mra-{config['app_env']}-ecs-service-fra-{config['resource_suffix']}"
+                                                            "ECSTaskStop": {
+                                                                "resourceType": "aws:ecs:task",
+                                                                "parameters": {
+                                                                    "cluster": self._ecs_cluster,
+                                                                    "service": self._ecs_service
                                                                 },
-                                                                selection_mode=f"PERCENT({percent})"
-                                                            )
-                                                        },
-                                                        actions={
-                                                            "ECSTaskStopAction": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:ecs:stop-task",
-                                                                description=f"ECS Task Stop for service app {ecs_app_name} with percent {percent}",
-                                                                parameters={},
-                                                                targets={
-                                                                    "Tasks": "ECSTaskStop"
-                                                                }
-                                                            )
-                                                        },
-                                                        experiment_options=fis.CfnExperimentTemplate.ExperimentTemplateExperimentOptionsProperty(
-                                                            account_targeting="single-account",
-                                                            empty_target_resolution_mode="fail"
-                                                        ),
-                                                        log_configuration=fis.CfnExperimentTemplate.ExperimentTemplateLogConfigurationProperty(
-                                                            cloud_watch_logs_configuration={
-                                                                "LogGroupArn": log_group.log_group_arn
-                                                            },
-                                                            log_schema_version=2
-                                                        ),
-                                                        stop_conditions=[
-                                                            {
-                                                                "source": "none"
+                                                                "selectionMode": selection_mode
                                                             }
-                                                        ],
-                                                        tags={
-                                                            "Name": f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-ecs-taskstop-{ecs_app_name}-p{percent}-experiment-{config['resource_suffix']}",
-                                                            "Environment": f"{config['app_env']}"
-                                                        }
-                                                        )
-
-        return experiment_template
-
-    def create_fis_ecs_task_cpustress_experiment(self, config, role, log_group, ecs_app_name, percent):
-        experiment_template = fis.CfnExperimentTemplate(self,
-                                                        f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-ecs-taskcpustress-{ecs_app_name}-p{percent}-experiment-{config['resource_suffix']}",
-                                                        description=f"CPU Stress ECS Task for service app {ecs_app_name} with percent {percent}",
-                                                        role_arn=role.role_arn,
-                                                        targets={
-                                                            "ECSTaskCPUStress": fis.CfnExperimentTemplate.ExperimentTemplateTargetProperty(
-                                                                resource_type="aws:ecs:task",
-                                                                parameters={
-                                                                    "cluster": f"{config['resource_prefix']}-mra-{config['app_env']}-ecs-cluster-fra-{config['resource_suffix']}",
-                                                                    "service": f"{config['resource_prefix']}-mra-{config['app_env']}-ecs-service-fra-{config['resource_suffix']}"
-                                                                },
-                                                                selection_mode=f"PERCENT({percent})"
-                                                            )
                                                         },
                                                         actions={
-                                                            "ECSTaskCPUStressAction": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:ecs:task-cpu-stress",
-                                                                description=f"ECS Task CPU Stress for service app {ecs_app_name} with percent {percent}",
-                                                                parameters={
-                                                                    "duration": "PT15M",
-                                                                    "installDependencies": "true",
-                                                                    "percent": "100",
-                                                                    "workers": "0"
-                                                                },
-                                                                targets={
-                                                                    "Tasks": "ECSTaskCPUStress"
+                                                            "ECSTaskStopAction": {
+                                                                "actionId": "aws:ecs:stop-task",
+                                                                "description": f"ECS Task Stop for service app {ecs_app_name} with percent {percent}",
+                                                                "parameters": {},
+                                                                "targets": {
+                                                                    "Tasks": "ECSTaskStop"
                                                                 }
-                                                            )
-                                                        },
-                                                        experiment_options=fis.CfnExperimentTemplate.ExperimentTemplateExperimentOptionsProperty(
-                                                            account_targeting="single-account",
-                                                            empty_target_resolution_mode="fail"
-                                                        ),
-                                                        log_configuration=fis.CfnExperimentTemplate.ExperimentTemplateLogConfigurationProperty(
-                                                            cloud_watch_logs_configuration={
-                                                                "LogGroupArn": log_group.log_group_arn
-                                                            },
-                                                            log_schema_version=2
-                                                        ),
-                                                        stop_conditions=[
-                                                            {
-                                                                "source": "none"
                                                             }
-                                                        ],
-                                                        tags={
-                                                            "Name": f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-ecs-taskcpustress-{ecs_app_name}-p{percent}-experiment-{config['resource_suffix']}",
-                                                            "Environment": f"{config['app_env']}"
-                                                        }
-                                                        )
-
-        return experiment_template
-
-    def create_fis_ecs_task_iostress_experiment(self, config, role, log_group, ecs_app_name, percent):
-        experiment_template = fis.CfnExperimentTemplate(self,
-                                                        f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-ecs-taskiostress-{ecs_app_name}-p{percent}-experiment-{config['resource_suffix']}",
-                                                        description=f"IO Stress ECS Task for service app {ecs_app_name} with percent {percent}",
-                                                        role_arn=role.role_arn,
-                                                        targets={
-                                                            "ECSTaskIOStress": fis.CfnExperimentTemplate.ExperimentTemplateTargetProperty(
-                                                                resource_type="aws:ecs:task",
-                                                                parameters={
-                                                                    "cluster": f"{config['resource_prefix']}-mra-{config['app_env']}-ecs-cluster-fra-{config['resource_suffix']}",
-                                                                    "service": f"{config['resource_prefix']}-mra-{config['app_env']}-ecs-service-fra-{config['resource_suffix']}"
-                                                                },
-                                                                selection_mode=f"PERCENT({percent})"
-                                                            )
                                                         },
-                                                        actions={
-                                                            "ECSTaskIOStressAction": fis.CfnExperimentTemplate.ExperimentTemplateActionProperty(
-                                                                action_id="aws:ecs:task-io-stress",
-                                                                description=f"ECS Task IO Stress for service app {ecs_app_name} with percent {percent}",
-                                                                parameters={
-                                                                    "duration": "PT15M",
-                                                                    "installDependencies": "true",
-                                                                    "percent": "80",
-                                                                    "workers": "1"
-                                                                },
-                                                                targets={
-                                                                    "Tasks": "ECSTaskIOStress"
-                                                                }
-                                                            )
-                                                        },
-                                                        experiment_options=fis.CfnExperimentTemplate.ExperimentTemplateExperimentOptionsProperty(
-                                                            account_targeting="single-account",
-                                                            empty_target_resolution_mode="fail"
-                                                        ),
-                                                        log_configuration=fis.CfnExperimentTemplate.ExperimentTemplateLogConfigurationProperty(
-                                                            cloud_watch_logs_configuration={
-                                                                "LogGroupArn": log_group.log_group_arn
-                                                            },
-                                                            log_schema_version=2
-                                                        ),
-                                                        stop_conditions=[
-                                                            {
-                                                                "source": "none"
-                                                            }
-                                                        ],
+                                                        **self._common_fis_kwargs,
                                                         tags={
-                                                            "Name": f"{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-{config['app_name']}-ecs-taskiostress-{ecs_app_name}-p{percent}-experiment-{config['resource_suffix']}",
-                                                            "Environment": f"{config['app_env']}"
+                                                            "Name": template_name,
+                                                            "Environment": self._tag_env
                                                         }
                                                         )
 
@@ -713,6 +526,15 @@ def handler(event, context):
         config = resource_config
         app_config = app_config
 
+        # Common resource name prefix/suffix used by every construct in the stack
+        self._name_base = sys.intern("-".join((config['resource_prefix'], config['service_name'], config['app_env'], config['app_name'])))
+        self._name_suffix = sys.intern(config['resource_suffix'])
+        self._ecs_cluster = f"{config['resource_prefix']}-mra-{config['app_env']}-ecs-cluster-fra-{config['resource_suffix']}"
+        self._ecs_service = f"{config['resource_prefix']}-mra-{config['app_env']}-ecs-service-fra-{config['resource_suffix']}"
+        self._rds_cluster_arn_prefix = f"arn:aws:rds:{self.region}:{self.account}:cluster:{config['resource_prefix']}-{config['service_name']}-{config['app_env']}-"
+        self._tag_env = config['app_env']
+        self._vpcs = {}
+
         bucket = self.create_artifact_store(config)
 
         # vpc lookup from account
@@ -722,57 +544,57 @@ def handler(event, context):
         log_group = self.create_log_group(config=config)
 
         # Only create IAM roles and other global resources in the primary region
-        if config.get("deployment_region") == config.get("primary_region"):
+        is_primary = config.get("deployment_region") == config.get("primary_region")
+        if is_primary:
             fis_role = self.create_fis_role(config=config)
+            role_arn_token, lg_arn_token = fis_role.role_arn, log_group.log_group_arn
+            cw_logs_cfg = {"LogGroupArn": lg_arn_token}
+            # Keyword arguments shared by every experiment template below
+            self._common_fis_kwargs = dict(
+                role_arn=role_arn_token,
+                experiment_options=_EXPERIMENT_OPTIONS,
+                log_configuration=fis.CfnExperimentTemplate.ExperimentTemplateLogConfigurationProperty(
+                    cloud_watch_logs_configuration=cw_logs_cfg,
+                    log_schema_version=2
+                ),
+                stop_conditions=_STOP_CONDITIONS
+            )
+
+            # Split the comma separated lists once, before the loops below
+            ecs_services = tuple(s.strip() for s in config['ecs_services'].split(","))
+            ecs_percents = tuple(config['ecs_taks_percents'].split(","))
+            db_clusters = tuple(config['db_clusters'].split(","))
 
             # FIS Experiment Template - App AZ subnet fail
-            self.create_fis_network_subnet_experiment(config=config, subnet_list=config['subnet_az1_list'],
-                                                      test_name="az1", role=fis_role, log_group=log_group,
-                                                      az_name=config['az1_name'], db_app_list=config['db_clusters']
-                                                      )
-            self.create_fis_network_subnet_experiment(config=config, subnet_list=config['subnet_az2_list'],
-                                                      test_name="az2", role=fis_role, log_group=log_group,
-                                                      az_name=config['az2_name'], db_app_list=config['db_clusters']
-                                                      )
+            for test_name, subnet_key, az_key in (("az1", "subnet_az1_list", "az1_name"),
+                                                  ("az2", "subnet_az2_list", "az2_name")):
+                self.create_fis_network_subnet_experiment(subnets=tuple(config[subnet_key].split(",")),
+                                                          test_name=test_name, az_name=config[az_key])
 
             # FIS Experiment Template - ECS stop
-            for ecs_name in config['ecs_services'].split(","):
-                for percent_val in config['ecs_taks_percents'].split(","):
-                    self.create_fis_ecs_task_stop_experiment(config=config, role=fis_role, log_group=log_group,
-                                                             ecs_app_name=ecs_name, percent=percent_val
-                                                             )
-
-            # DO NOT ENABLE ---- FIS Experiment Template - ECS CPU stress
-            # for ecs_name in config['ecs_services'].split(","):
-            #     for percent_val in config['ecs_taks_percents'].split(","):
-            #         self.create_fis_ecs_task_cpustress_experiment(config=config, role=fis_role, log_group=log_group,
-            #             ecs_app_name=ecs_name, percent=percent_val
-            #         )
-
-            # DO NOT ENABLE ---- FIS Experiment Template - ECS IO stress - Future test cases
-            # for ecs_name in config['ecs_services'].split(","):
-            #     for percent_val in config['ecs_taks_percents'].split(","):
-            #         self.create_fis_ecs_task_iostress_experiment(config=config, role=fis_role, log_group=log_group,
-            #             ecs_app_name=ecs_name, percent=percent_val
-            #         )
-
-            # for percent_val in config['ecs_drain_percents'].split(","):
-            #     self.create_fis_ecs_cluster_drain_experiment(config=config, role=fis_role,
-            #         log_group=log_group, percent=percent_val
-            #     )
-
-            for db_name in config['db_clusters'].split(","):
-                self.create_fis_rds_failover_experiment(config=config, role=fis_role, log_group=log_group, db_app_name=db_name)
+            mk_ecs_stop = self.create_fis_ecs_task_stop_experiment
+            selection_modes = {p: sys.intern(f"PERCENT({p})") for p in ecs_percents}
+            for ecs_name, percent_val in product(ecs_services, ecs_percents):
+                mk_ecs_stop(ecs_app_name=ecs_name, percent=percent_val, selection_mode=selection_modes[percent_val])
+
+            mk_rds = self.create_fis_rds_failover_experiment
+            for db_name in db_clusters:
+                mk_rds(db_app_name=db_name)
 
         # synthetics canary
-        if config.get("deployment_region") == config.get("primary_region"):
-            canary_role = self.create_canary_role(config=config, bucket_name=bucket.bucket_name)
-        canary_script = self.canary_script_data(config=config)
-        canary_sg = self.create_canary_security_group(config=config, vpc=vpc)
-
-        for app in app_config:
-            for app_name, app_url in zip(app.get_app_names(), app.get_app_urls()):
-                self.create_canary(config=config, vpc=vpc, subnet_ids=[app.get_subnet_id()],
-                                   security_group_id=[canary_sg.security_group_id], canary_role=canary_role,
-                                   target_url=app_url, canary_script=canary_script,
-                                   app_name=f"{app_name}-{app.get_canary_name()}", bucket_name=bucket.bucket_name)
+        if is_primary:
+            canary_role = self.create_canary_role(config=config, bucket=bucket)
+
+        # Canaries need the canary role, which only exists in the primary region;
+        # skip the security group too when there is nothing to attach it to
+        if app_config and is_primary:
+            canary_sg = self.create_canary_security_group(config=config, vpc=vpc)
+            for app in app_config:
+                # Call each getter once per app rather than once per canary
+                names, urls = app.get_app_names(), app.get_app_urls()
+                subnet_ids, canary_name = [app.get_subnet_id()], app.get_canary_name()
+                for app_name, app_url in zip(names, urls):
+                    self.create_canary(config=config, vpc=vpc, subnet_ids=subnet_ids,
+                                       security_group_id=[canary_sg.security_group_id], canary_role=canary_role,
+                                       target_url=app_url, canary_script=_CANARY_SCRIPT,
+                                       app_name=f"{app_name}-{canary_name}", bucket_name=bucket.bucket_name)
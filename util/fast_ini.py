@@ -0,0 +1,41 @@
+import re
+from pathlib import Path
+
+# Minimal reader for the flat resource.*.config files. It only understands
+# "[section]" headers, "key = value" lines and full-line "#"/";" comments;
+# interpolation, multiline continuations, ":" delimiters, indented lines,
+# inline comments and [DEFAULT] inheritance are NOT supported ([DEFAULT] is
+# returned as an ordinary section). Anything else, and repeated sections or
+# keys (like configparser's strict mode), raises ValueError rather than being
+# dropped or overwritten. Keys are lower-cased like configparser's default
+# optionxform.
+SECTION_RE = re.compile(r'^\[([^\]]+)\][ \t\r]*$')
+KV_RE = re.compile(r'^([^=\s;#\[][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$')
+
+
+def parse(text):
+    sections = {}
+    section = None
+    for lineno, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        match = SECTION_RE.match(line)
+        if match:
+            name = match.group(1).strip()
+            if name in sections:
+                raise ValueError(f"Duplicate section {name!r} on config line {lineno}")
+            section = sections[name] = {}
+            continue
+        match = KV_RE.match(line)
+        if match is None or section is None:
+            raise ValueError(f"Unsupported config line {lineno}: {line!r}")
+        key = match.group(1).lower()
+        if key in section:
+            raise ValueError(f"Duplicate key {key!r} on config line {lineno}")
+        section[key] = match.group(2)
+    return sections
+
+
+def load(file_path):
+    return parse(Path(file_path).read_text())